@@ -367,6 +367,73 @@ async def test_send_webhook_server_error():
             await notifier._send_webhook(embed)
 
 
+def _ok_response():
+    """Build a mock 200 response usable as an async context manager."""
+    response = MagicMock()
+    response.status = 200
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_send_webhook_retries_connection_failures():
+    """Test _send_webhook retries when the connection could not be made."""
+    import aiohttp
+    from tenacity import wait_none
+    
+    notifier = DiscordNotifier("https://discord.com/api/webhooks/123/abc")
+    
+    connect_error = aiohttp.ClientConnectorError(MagicMock(), OSError("refused"))
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(side_effect=[connect_error, _ok_response()])
+    
+    notifier.session = mock_session
+    with patch.object(DiscordNotifier._send_webhook.retry, 'wait', wait_none()):
+        await notifier._send_webhook({"title": "Test"})
+    
+    assert mock_session.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_webhook_does_not_retry_after_request_sent():
+    """Test errors after the request went out are not retried (no duplicates)."""
+    import aiohttp
+    
+    notifier = DiscordNotifier("https://discord.com/api/webhooks/123/abc")
+    
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(side_effect=aiohttp.ServerDisconnectedError())
+    
+    notifier.session = mock_session
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        await notifier._send_webhook({"title": "Test"})
+    
+    assert mock_session.post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_send_webhook_waits_for_short_retry_after():
+    """Test a 429 with a short Retry-After is resent after sleeping."""
+    notifier = DiscordNotifier("https://discord.com/api/webhooks/123/abc")
+    
+    limited = MagicMock()
+    limited.status = 429
+    limited.headers = {"Retry-After": "1.5"}
+    limited.__aenter__ = AsyncMock(return_value=limited)
+    limited.__aexit__ = AsyncMock(return_value=None)
+    
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(side_effect=[limited, _ok_response()])
+    
+    notifier.session = mock_session
+    with patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+        await notifier._send_webhook({"title": "Test"})
+    
+    mock_sleep.assert_awaited_once_with(1.5)
+    assert mock_session.post.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_send_approval_raises_webhook_error_on_failure():
     """Test send_approval_request raises WebhookError on failure."""
@@ -482,3 +549,36 @@ async def test_send_success_notification_real():
         
         assert result is True
         mock_send.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_context_manager_reuses_session():
+    """Webhook calls inside ``async with`` share one HTTP session."""
+    notifier = DiscordNotifier("https://discord.com/api/webhooks/123/abc")
+
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(return_value=_ok_response())
+    mock_session.close = AsyncMock()
+
+    with patch('aiohttp.ClientSession', return_value=mock_session) as session_cls, \
+         patch('aiohttp.TCPConnector'):
+        async with notifier:
+            await notifier._send_webhook({"title": "One"})
+            await notifier._send_webhook({"title": "Two"})
+
+        session_cls.assert_called_once()
+        assert mock_session.post.call_count == 2
+        mock_session.close.assert_awaited_once()
+        assert notifier.session is None
+
+
+@pytest.mark.asyncio
+async def test_context_manager_skips_session_in_dry_run():
+    """Dry-run notifiers never open an HTTP session."""
+    notifier = DiscordNotifier("https://discord.com/api/webhooks/123/abc", dry_run=True)
+
+    with patch('aiohttp.ClientSession') as session_cls:
+        async with notifier:
+            assert notifier.session is None
+
+        session_cls.assert_not_called()
@@ -297,6 +297,47 @@ def test_add_text_overlay_positions(test_base_image, branding_config):
         assert img.size == (800, 450)
 
 
+def test_opaque_banner_stays_rgb(test_base_image, test_logo, branding_config):
+    """Test opaque base images are not widened to RGBA."""
+    compositor = ImageCompositor(branding_config)
+    
+    result = compositor.composite_logo(test_base_image, logo_path=test_logo)
+    
+    assert Image.open(BytesIO(result)).mode == 'RGB'
+
+
+def test_logo_layers_reused_across_composites(test_base_image, test_logo, branding_config):
+    """Test the prepared logo and shadow are reused for the same logo file."""
+    compositor = ImageCompositor(branding_config)
+    
+    first = compositor.composite_logo(test_base_image, logo_path=test_logo)
+    logo, shadow = compositor._get_logo_layers(test_logo)
+    second = compositor.composite_logo(test_base_image, logo_path=test_logo)
+    
+    assert first == second
+    assert compositor._get_logo_layers(test_logo)[0] is logo
+    assert compositor._get_logo_layers(test_logo)[1] is shadow
+    
+    # Changing branding settings invalidates the cached layers
+    compositor.config.logo_size_percent += 5
+    assert compositor._get_logo_layers(test_logo)[0] is not logo
+
+
+def test_text_overlay_font_is_cached(test_base_image, branding_config):
+    """Test repeated overlays reuse the loaded font."""
+    from wishlistops.image_compositor import _load_font
+    
+    compositor = ImageCompositor(branding_config)
+    _load_font.cache_clear()
+    
+    compositor.add_text_overlay(test_base_image, text="v1.0")
+    compositor.add_text_overlay(test_base_image, text="v1.1")
+    
+    info = _load_font.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
 def test_composite_logo_simple_convenience_function(test_base_image, test_logo):
     """Test convenience function works."""
     result = composite_logo_simple(
@@ -7,7 +7,7 @@ and error handling for the StateManager class.
 
 import pytest
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from wishlistops.state_manager import StateManager, StateCorruptedError
 from wishlistops.models import AnnouncementDraft
 
@@ -316,11 +316,23 @@ def test_invalid_last_post_date_format(temp_state_path):
     assert manager.get_last_post_date() is None
 
 
+def test_last_post_date_parse_is_cached(temp_state_path):
+    """Test that the parsed last post date is reused until the value changes."""
+    manager = StateManager(temp_state_path)
+    manager.update_last_post(title="Test Post")
+    
+    first = manager.get_last_post_date()
+    assert manager.get_last_post_date() is first
+    
+    manager.state.last_post_date = "2024-01-01T00:00:00"
+    assert manager.get_last_post_date() == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def test_state_metadata(temp_state_path):
     """Test state metadata fields."""
     manager = StateManager(temp_state_path)
     
-    assert manager.state.version == "1.0"
+    assert manager.state.version == "2.0"
     assert manager.state.created_at is not None
     assert manager.state.updated_at is not None
     
@@ -363,3 +375,256 @@ def test_concurrent_access_with_lock(temp_state_path):
     
     # Total runs should be 5
     assert manager.state.total_runs == 5
+
+
+def test_transaction_batches_saves(temp_state_path):
+    """Test updates inside a transaction are written once on exit."""
+    manager = StateManager(temp_state_path)
+    
+    with manager.transaction():
+        manager.update_last_run(status="success", tag="v1.0.0")
+        manager.update_last_post(title="Batched Post")
+        
+        # Nothing written until the transaction exits
+        assert not temp_state_path.exists()
+    
+    assert temp_state_path.exists()
+    
+    reloaded = StateManager(temp_state_path)
+    assert reloaded.state.total_runs == 1
+    assert reloaded.state.last_post_title == "Batched Post"
+
+
+def test_transaction_rolls_back_on_error(temp_state_path):
+    """Test a transaction that raises writes nothing and restores state."""
+    manager = StateManager(temp_state_path)
+    manager.update_last_run(status="success", tag="v1.0.0")
+    
+    with pytest.raises(RuntimeError):
+        with manager.transaction():
+            manager.update_last_run(status="success", tag="half")
+            raise RuntimeError("boom")
+    
+    assert manager.state.last_tag == "v1.0.0"
+    assert manager.state.total_runs == 1
+    
+    reloaded = StateManager(temp_state_path)
+    assert reloaded.state.last_tag == "v1.0.0"
+
+
+def test_transaction_batches_updates_from_other_threads(temp_state_path):
+    """Test updates from another thread join an open transaction's batch."""
+    import threading
+    
+    manager = StateManager(temp_state_path)
+    
+    with manager.transaction():
+        worker = threading.Thread(
+            target=manager.update_last_run,
+            kwargs={"status": "success", "tag": "v1.0.0"}
+        )
+        worker.start()
+        worker.join()
+        
+        # Deferred with the rest of the batch
+        assert not temp_state_path.exists()
+    
+    assert StateManager(temp_state_path).state.last_tag == "v1.0.0"
+
+
+def test_transaction_rollback_discards_other_threads_updates(temp_state_path):
+    """Test a failed transaction rolls back every update made while it was open."""
+    import threading
+    
+    manager = StateManager(temp_state_path)
+    
+    with pytest.raises(RuntimeError):
+        with manager.transaction():
+            worker = threading.Thread(
+                target=manager.update_last_run,
+                kwargs={"status": "success", "tag": "v1.0.0"}
+            )
+            worker.start()
+            worker.join()
+            raise RuntimeError("boom")
+    
+    assert manager.state.total_runs == 0
+    assert not temp_state_path.exists()
+
+
+def test_overlapping_transactions_on_threads(temp_state_path):
+    """Test a batch spanning two threads rolls back if the last one raises."""
+    import threading
+    
+    manager = StateManager(temp_state_path)
+    a_entered, b_entered, a_exited = threading.Event(), threading.Event(), threading.Event()
+    errors: list[BaseException] = []
+    
+    def first():
+        with manager.transaction():
+            manager.update_last_run(status="success", tag="from-a")
+            a_entered.set()
+            b_entered.wait(5)
+        a_exited.set()
+    
+    def second():
+        a_entered.wait(5)
+        try:
+            with manager.transaction():
+                b_entered.set()
+                a_exited.wait(5)
+                raise RuntimeError("boom")
+        except BaseException as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(errors) == 1 and isinstance(errors[0], RuntimeError)
+    assert manager.state.total_runs == 0
+    assert not temp_state_path.exists()
+
+
+def test_flush_without_changes_is_noop(temp_state_path):
+    """Test flush does not write when nothing changed."""
+    manager = StateManager(temp_state_path)
+    manager.flush()
+    
+    assert not temp_state_path.exists()
+
+
+def test_backup_preserves_previous_contents(temp_state_path):
+    """Test backup keeps the pre-save snapshot after state is replaced."""
+    manager = StateManager(temp_state_path)
+    manager.update_last_run(status="success", tag="v1.0.0")
+    manager.update_last_run(status="success", tag="v2.0.0")
+    
+    backups = sorted(manager.backup_dir.glob("state_*.json"))
+    assert len(backups) == 1
+    assert '"v1.0.0"' in backups[0].read_text(encoding="utf-8")
+    assert '"v2.0.0"' in temp_state_path.read_text(encoding="utf-8")
+
+
+def test_recent_runs_stored_column_wise(temp_state_path):
+    """Test recent runs are written in the columnar 2.0 layout."""
+    import json
+    
+    manager = StateManager(temp_state_path)
+    manager.update_last_run(status="success", tag="v1.0.0")
+    manager.update_last_run(status="failed", tag="v1.1.0", error="boom")
+    
+    data = json.loads(temp_state_path.read_text(encoding="utf-8"))
+    assert data["version"] == "2.0"
+    assert data["recent_runs"]["tag"] == ["v1.1.0", "v1.0.0"]
+    assert data["recent_runs"]["error"] == ["boom", None]
+    
+    reloaded = StateManager(temp_state_path)
+    assert [run.tag for run in reloaded.state.recent_runs] == ["v1.1.0", "v1.0.0"]
+    assert reloaded.state.recent_runs[0].status == "failed"
+
+
+def test_recent_runs_dumped_as_list_in_python_mode(temp_state_path):
+    """Test only JSON output uses the columnar layout."""
+    manager = StateManager(temp_state_path)
+    manager.update_last_run(status="success", tag="v1.0.0")
+    
+    dumped = manager.state.model_dump()
+    assert isinstance(dumped["recent_runs"], list)
+    assert dumped["recent_runs"][0]["tag"] == "v1.0.0"
+
+
+@pytest.mark.parametrize("recent_runs", [
+    # Columns left with different lengths, e.g. by a bad merge
+    {"timestamp": ["2024-01-02T00:00:00", "2024-01-01T00:00:00"], "status": ["success"]},
+    # Column that is not a list
+    {"timestamp": "2024-01-01T00:00:00", "status": "success"},
+    # Missing timestamp column
+    {"status": ["success"]},
+])
+def test_malformed_run_columns_raise_corrupted_error(temp_state_path, recent_runs):
+    """Test malformed columnar recent_runs are reported as corruption."""
+    import json
+    
+    temp_state_path.write_text(
+        json.dumps({"version": "2.0", "recent_runs": recent_runs}),
+        encoding="utf-8"
+    )
+    
+    with pytest.raises(StateCorruptedError):
+        StateManager(temp_state_path)
+
+
+def test_migrates_v1_state_file(temp_state_path):
+    """Test a 1.0 state file with a list of runs still loads."""
+    import json
+    
+    temp_state_path.write_text(json.dumps({
+        "version": "1.0",
+        "total_runs": 1,
+        "recent_runs": [
+            {"timestamp": "2024-01-01T00:00:00+00:00", "tag": "v0.9.0", "status": "success"}
+        ]
+    }), encoding="utf-8")
+    
+    manager = StateManager(temp_state_path)
+    assert manager.state.version == "2.0"
+    assert manager.state.recent_runs[0].tag == "v0.9.0"
+
+
+def test_unchanged_state_skips_save(temp_state_path):
+    """Test saving identical state does not rewrite or back up."""
+    manager = StateManager(temp_state_path)
+    manager.update_last_run(status="success")
+    mtime = temp_state_path.stat().st_mtime_ns
+    
+    manager._save()
+    
+    assert temp_state_path.stat().st_mtime_ns == mtime
+    assert list(manager.backup_dir.glob("state_*.json")) == []
+
+
+def test_multi_process_mode_uses_file_lock(temp_state_path):
+    """Test single_process=False guards writes with a file lock."""
+    from filelock import FileLock
+    
+    manager = StateManager(temp_state_path, single_process=False)
+    assert isinstance(manager._lock, FileLock)
+    
+    manager.update_last_run(status="success", tag="v1.0.0")
+    assert StateManager(temp_state_path).state.last_tag == "v1.0.0"
+
+
+def test_multi_process_backups_shared_between_managers(temp_state_path):
+    """Test managers sharing a state file prune and restore each other's backups."""
+    
+    first = StateManager(temp_state_path, single_process=False)
+    second = StateManager(temp_state_path, single_process=False)
+    first.update_last_run(status="success", tag="v1.0.0")
+    
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(8):
+        manager = (first, second)[i % 2]
+        manager.state.total_runs += 1
+        manager._save(now=base + timedelta(minutes=i))
+    
+    backups = sorted(p.name for p in first.backup_dir.glob("state_*.json"))
+    assert len(backups) == StateManager.MAX_BACKUPS
+    assert backups[-1] == "state_20240101_000700.json"
+    
+    # Both managers see the newest backup, whichever one wrote it
+    assert first._list_backups()[-1] == backups[-1]
+    assert second._list_backups()[-1] == backups[-1]
+
+
+@pytest.mark.asyncio
+async def test_update_last_run_async(temp_state_path):
+    """Test async update persists state from a worker thread."""
+    manager = StateManager(temp_state_path)
+    
+    await manager.update_last_run_async(status="success", tag="v1.0.0")
+    
+    assert manager.state.total_runs == 1
+    assert StateManager(temp_state_path).state.last_tag == "v1.0.0"
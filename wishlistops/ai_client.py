@@ -16,6 +16,7 @@ from typing import Optional, Any
 from pathlib import Path
 
 import aiohttp
+import orjson
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -210,7 +211,7 @@ class GeminiClient:
                     )
                 
                 # Parse response
-                data = await response.json()
+                data = await response.json(loads=orjson.loads)
                 result = self._parse_text_response(data)
                 
                 logger.info("Text generation successful", extra={
@@ -375,7 +376,7 @@ class GeminiClient:
                     )
                 
                 # Parse response
-                data = await response.json()
+                data = await response.json(loads=orjson.loads)
                 result = self._parse_image_response(data)
                 
                 logger.info("Image generation successful", extra={
@@ -11,6 +11,7 @@ import os
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from pydantic import ValidationError
 
 from .models import Config
@@ -54,11 +55,10 @@ class ConfigManager:
         
         logger.info(f"Loading configuration from: {config_path}")
         
-        # Load JSON
+        # Load JSON (orjson parses bytes directly; its errors subclass JSONDecodeError)
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(config_path.read_bytes())
+        except orjson.JSONDecodeError as e:
             raise ConfigurationError(
                 f"Invalid JSON syntax in {config_path}:\n"
                 f"  Line {e.lineno}, Column {e.colno}\n"
@@ -7,6 +7,7 @@ This is the critical quality gate that prevents AI mistakes.
 Architecture: See 05_WishlistOps_Revised_Architecture.md Fix #2
 """
 
+import asyncio
 import json
 import logging
 from typing import Optional, List, Dict, Any
@@ -14,6 +15,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import aiohttp
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    retry_if_exception_type
+)
 
 
 logger = logging.getLogger(__name__)
@@ -29,6 +36,14 @@ class WebhookError(DiscordError):
     pass
 
 
+class RateLimitError(WebhookError):
+    """Raised when Discord rejects a webhook with HTTP 429."""
+    
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class DiscordNotifier:
     """
     Send notifications to Discord via webhooks.
@@ -36,9 +51,14 @@ class DiscordNotifier:
     This class handles sending draft announcements to Discord channels
     for human approval before posting to Steam.
     
+    Use as an async context manager to reuse one HTTP session (and its
+    keep-alive connections) across notifications; outside a context a
+    one-off session is opened per webhook call.
+    
     Attributes:
         webhook_url: Discord webhook URL
         dry_run: If True, log notifications without sending
+        session: Shared async HTTP session (set inside ``async with``)
     """
     
     # Discord limits
@@ -46,6 +66,8 @@ class DiscordNotifier:
     MAX_FIELD_VALUE = 1024
     MAX_TITLE = 256
     RATE_LIMIT_DELAY = 2  # seconds between requests
+    RATE_LIMIT_RETRIES = 2  # resends after a 429
+    MAX_RETRY_AFTER = 10  # seconds; longer waits fail instead of stalling the run
     
     def __init__(self, webhook_url: Optional[str], dry_run: bool = False) -> None:
         """
@@ -67,6 +89,7 @@ class DiscordNotifier:
         
         self.webhook_url = webhook_url
         self.dry_run = dry_run
+        self.session: Optional[aiohttp.ClientSession] = None
         
         if dry_run:
             logger.info("Discord notifier initialized in DRY RUN mode")
@@ -75,6 +98,24 @@ class DiscordNotifier:
                 "webhook_configured": bool(webhook_url)
             })
     
+    async def __aenter__(self):
+        """Async context manager entry."""
+        if self.webhook_url and not self.dry_run:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+            )
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self.session:
+            await self.session.close()
+            self.session = None
+    
     async def send_approval_request(
         self,
         title: str,
@@ -371,6 +412,14 @@ class DiscordNotifier:
             logger.error(f"Failed to send success notification: {e}")
             return False
     
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        # Only failures to connect: the POST never reached Discord, so
+        # resending cannot duplicate the message
+        retry=retry_if_exception_type(aiohttp.ClientConnectorError),
+        reraise=True
+    )
     async def _send_webhook(
         self,
         embed: dict,
@@ -381,6 +430,13 @@ class DiscordNotifier:
         """
         Send payload to Discord webhook.
         
+        Connection failures are retried with exponential backoff. A 429 is
+        retried after the ``Retry-After`` delay when that is at most
+        ``MAX_RETRY_AFTER`` seconds. Other errors (timeouts, dropped
+        connections) are not retried, since Discord may already have
+        accepted the message. The payload, including any multipart form,
+        is rebuilt for each attempt.
+        
         Args:
             embed: Discord embed object
             components: Optional list of interactive components (buttons)
@@ -395,48 +451,81 @@ class DiscordNotifier:
         
         if components:
             payload["components"] = components
-
-        request_kwargs: Dict[str, Any] = {"timeout": aiohttp.ClientTimeout(total=10)}
-        if file_bytes:
-            form = aiohttp.FormData()
-            form.add_field("payload_json", json.dumps(payload), content_type="application/json")
-            form.add_field(
-                "file",
-                file_bytes,
-                filename=filename or "banner.png",
-                content_type="application/octet-stream"
-            )
-            request_kwargs["data"] = form
-        else:
-            request_kwargs["json"] = payload
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.webhook_url,
-                **request_kwargs
-            ) as response:
-                
-                if response.status == 429:
-                    # Rate limited
-                    retry_after = response.headers.get('Retry-After', '60')
-                    raise WebhookError(
-                        f"Discord rate limit hit. Retry after {retry_after}s"
-                    )
-                
-                if response.status == 404:
-                    raise WebhookError(
-                        "Discord webhook not found. Check your webhook URL."
-                    )
-                
-                if response.status >= 400:
-                    error_text = await response.text()
-                    raise WebhookError(
-                        f"Discord API error (status {response.status}): {error_text}"
-                    )
-                
-                logger.debug("Discord webhook sent successfully", extra={
-                    "status": response.status
-                })
+        
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            request_kwargs: Dict[str, Any] = {"timeout": aiohttp.ClientTimeout(total=10)}
+            if file_bytes:
+                form = aiohttp.FormData()
+                form.add_field("payload_json", json.dumps(payload), content_type="application/json")
+                form.add_field(
+                    "file",
+                    file_bytes,
+                    filename=filename or "banner.png",
+                    content_type="application/octet-stream"
+                )
+                request_kwargs["data"] = form
+            else:
+                request_kwargs["json"] = payload
+            
+            try:
+                if self.session:
+                    await self._post_webhook(self.session, request_kwargs)
+                else:
+                    async with aiohttp.ClientSession() as session:
+                        await self._post_webhook(session, request_kwargs)
+                return
+            except RateLimitError as e:
+                if attempt == self.RATE_LIMIT_RETRIES or e.retry_after > self.MAX_RETRY_AFTER:
+                    raise
+                logger.warning("Discord rate limited, retrying in %ss", e.retry_after)
+                await asyncio.sleep(e.retry_after)
+    
+    async def _post_webhook(
+        self,
+        session: aiohttp.ClientSession,
+        request_kwargs: Dict[str, Any]
+    ) -> None:
+        """
+        POST a prepared payload to the webhook and check the response.
+        
+        Args:
+            session: HTTP session to send with
+            request_kwargs: Keyword arguments for ``session.post``
+            
+        Raises:
+            RateLimitError: If Discord responds with 429
+            WebhookError: If delivery fails
+        """
+        async with session.post(
+            self.webhook_url,
+            **request_kwargs
+        ) as response:
+            
+            if response.status == 429:
+                # Rate limited
+                try:
+                    retry_after = float(response.headers.get('Retry-After', '60'))
+                except ValueError:
+                    retry_after = 60.0
+                raise RateLimitError(
+                    f"Discord rate limit hit. Retry after {retry_after:g}s",
+                    retry_after=retry_after
+                )
+            
+            if response.status == 404:
+                raise WebhookError(
+                    "Discord webhook not found. Check your webhook URL."
+                )
+            
+            if response.status >= 400:
+                error_text = await response.text()
+                raise WebhookError(
+                    f"Discord API error (status {response.status}): {error_text}"
+                )
+            
+            logger.debug("Discord webhook sent successfully", extra={
+                "status": response.status
+            })
 
 
 # Convenience function for quick notifications
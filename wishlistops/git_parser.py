@@ -28,9 +28,14 @@ SCREENSHOT_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
 SCREENSHOT_DIR_HINTS = ("screenshots", "promo", "marketing", "media")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Commit:
-	"""Represents a Git commit with metadata and optional screenshot."""
+	"""
+	Represents a Git commit with metadata and optional screenshot.
+
+	Slotted and frozen: one instance is created per commit in a history
+	scan, so dropping the per-instance ``__dict__`` adds up.
+	"""
 	sha: str
 	message: str
 	author: str
@@ -24,6 +24,7 @@ Error Handling:
 
 import argparse
 import asyncio
+import functools
 import logging
 import sys
 from datetime import datetime
@@ -50,6 +51,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# CLI defaults, resolved once at import rather than on every invocation
+_DEFAULT_CONFIG_PATH = Path("wishlistops/config.json")
+_BANNERS_DIR = Path("wishlistops/banners")
+
 
 class WorkflowError(Exception):
     """Base exception for workflow errors."""
@@ -144,29 +149,30 @@ class WishlistOpsOrchestrator:
         logger.info("Starting WishlistOps workflow execution")
         logger.info("="*60)
         
-        workflow_state = WorkflowState(
-            status=WorkflowStatus.SUCCESS,
-            started_at=datetime.now().isoformat()
-        )
+        started_at = datetime.now().isoformat()
         
         try:
             # Step 1: Check if we should run (rate limiting)
             if not self._should_run():
                 logger.info("Skipping run due to rate limits")
-                workflow_state.status = WorkflowStatus.SKIPPED
-                workflow_state.reason = "rate_limit"
-                workflow_state.completed_at = datetime.now().isoformat()
-                return workflow_state
+                return WorkflowState(
+                    status=WorkflowStatus.SKIPPED,
+                    reason="rate_limit",
+                    started_at=started_at,
+                    completed_at=datetime.now().isoformat()
+                )
             
-            async with self.ai:
+            async with self.ai, self.notifier:
                 # Step 2: Parse Git commits
                 commits = await self._parse_commits()
                 if not commits:
                     logger.info("No new commits found, ending run")
-                    workflow_state.status = WorkflowStatus.SKIPPED
-                    workflow_state.reason = "no_commits"
-                    workflow_state.completed_at = datetime.now().isoformat()
-                    return workflow_state
+                    return WorkflowState(
+                        status=WorkflowStatus.SKIPPED,
+                        reason="no_commits",
+                        started_at=started_at,
+                        completed_at=datetime.now().isoformat()
+                    )
                 
                 logger.info(f"Found {len(commits)} commits to process")
                 
@@ -188,24 +194,22 @@ class WishlistOpsOrchestrator:
                 logger.info("Sent to Discord for approval")
                 
                 # Step 7: Update state
-                self.state.update_last_run(draft)
+                await self.state.update_last_run_async(draft)
                 logger.info("State updated successfully")
                 
-                workflow_state.status = WorkflowStatus.SUCCESS
-                workflow_state.draft = draft
-                workflow_state.completed_at = datetime.now().isoformat()
-                
                 logger.info("="*60)
                 logger.info("✅ Workflow completed successfully")
                 logger.info("="*60)
                 
-                return workflow_state
+                return WorkflowState(
+                    status=WorkflowStatus.SUCCESS,
+                    draft=draft,
+                    started_at=started_at,
+                    completed_at=datetime.now().isoformat()
+                )
             
         except Exception as e:
             logger.error(f"❌ Workflow failed: {e}", exc_info=True)
-            workflow_state.status = WorkflowStatus.FAILED
-            workflow_state.error = str(e)
-            workflow_state.completed_at = datetime.now().isoformat()
             
             try:
                 await self.notifier.send_error(str(e))
@@ -438,7 +442,21 @@ Personality: {self.config.voice.personality}
         logger.info("Generating banner image")
         
         try:
-            base_image_bytes = self._load_deterministic_screenshot(commits)
+            compositor = self.compositor
+            logo_path = None
+            if compositor and self.config.branding and self.config.branding.logo_path:
+                logo_path = Path(self.config.branding.logo_path)
+            
+            # Read the screenshot while the logo is decoded in another thread
+            load_screenshot = asyncio.to_thread(self._load_deterministic_screenshot, commits)
+            if compositor and logo_path and logo_path.exists():
+                base_image_bytes, _ = await asyncio.gather(
+                    load_screenshot,
+                    asyncio.to_thread(compositor.prepare_logo, logo_path)
+                )
+            else:
+                base_image_bytes = await load_screenshot
+            
             if not base_image_bytes:
                 logger.warning("No deterministic screenshot found; skipping banner creation")
                 draft.banner_url = None
@@ -449,7 +467,6 @@ Personality: {self.config.voice.personality}
             # Composite logo if compositor available
             final_image = base_image_bytes
             if self.compositor and self.config.branding:
-                logo_path = Path(self.config.branding.logo_path) if self.config.branding.logo_path else None
                 final_image = self.compositor.composite_logo(
                     base_image_bytes,
                     logo_path=logo_path
@@ -476,10 +493,9 @@ Personality: {self.config.voice.personality}
     def _load_deterministic_screenshot(self, commits: list[Commit]) -> Optional[bytes]:
         """Return screenshot bytes using explicit or implicit commit attachment."""
         for commit in commits:
-            screenshot_attr = getattr(commit, "screenshot_path", None)
-            if not screenshot_attr:
+            if not commit.screenshot_path:
                 continue
-            path = Path(str(screenshot_attr))
+            path = Path(commit.screenshot_path)
             if path.exists():
                 try:
                     return path.read_bytes()
@@ -608,7 +624,7 @@ Return a JSON object with "title" and "body" keys.
             URL or path to saved banner
         """
         # Create banners directory if it doesn't exist
-        banners_dir = Path("wishlistops/banners")
+        banners_dir = _BANNERS_DIR
         banners_dir.mkdir(exist_ok=True)
         
         # Generate filename with timestamp
@@ -627,8 +643,9 @@ Return a JSON object with "title" and "body" keys.
         return str(filepath)
 
 
-def main() -> None:
-    """Main entry point for CLI."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (constructed once per process)."""
     parser = argparse.ArgumentParser(
         description="WishlistOps - Automate Steam marketing for indie games",
         epilog="See documentation at: https://github.com/your-org/wishlistops"
@@ -636,7 +653,7 @@ def main() -> None:
     parser.add_argument(
         "--config",
         type=Path,
-        default=Path("wishlistops/config.json"),
+        default=_DEFAULT_CONFIG_PATH,
         help="Path to configuration file"
     )
     parser.add_argument(
@@ -649,8 +666,12 @@ def main() -> None:
         action="store_true",
         help="Enable debug logging"
     )
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    """Main entry point for CLI."""
+    args = _build_parser().parse_args()
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
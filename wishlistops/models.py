@@ -1,10 +1,13 @@
 """
 Data models for WishlistOps configuration and runtime state.
 
-All models use Pydantic for validation and type safety.
+Models that cross an external boundary (config files, persisted state,
+AI output) use Pydantic for validation and type safety. Internal runtime
+carriers are plain slotted dataclasses.
 See: 04_WishlistOps_System_Architecture_Diagrams.md Section 10
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -37,15 +40,6 @@ class LogoPosition(str, Enum):
     BOTTOM_RIGHT = "bottom-right"
 
 
-class LogoPosition(str, Enum):
-    """Valid logo positions on generated banners."""
-    TOP_LEFT = "top-left"
-    TOP_RIGHT = "top-right"
-    CENTER = "center"
-    BOTTOM_LEFT = "bottom-left"
-    BOTTOM_RIGHT = "bottom-right"
-
-
 class SteamConfig(BaseModel):
     """Steam platform configuration."""
     model_config = ConfigDict(extra='forbid')
@@ -331,10 +325,14 @@ class AnnouncementDraft(BaseModel):
     approved_at: Optional[str] = Field(None, description="Approval timestamp")
 
 
-class WorkflowState(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WorkflowState:
     """
     State of a workflow execution.
     
+    Built by the orchestrator from already-validated values, so it skips
+    Pydantic validation entirely.
+    
     Attributes:
         status: Execution status
         reason: Optional reason for status (e.g., why skipped)
@@ -343,14 +341,12 @@ class WorkflowState(BaseModel):
         started_at: When workflow started
         completed_at: When workflow completed
     """
-    model_config = ConfigDict(extra='allow')
-    
-    status: WorkflowStatus = Field(..., description="Workflow status")
-    reason: Optional[str] = Field(None, description="Status reason")
-    draft: Optional[AnnouncementDraft] = Field(None, description="Generated draft")
-    error: Optional[str] = Field(None, description="Error message")
-    started_at: str = Field(default_factory=lambda: datetime.now().isoformat())
-    completed_at: Optional[str] = Field(None, description="Completion timestamp")
+    status: WorkflowStatus
+    reason: Optional[str] = None
+    draft: Optional[AnnouncementDraft] = None
+    error: Optional[str] = None
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    completed_at: Optional[str] = None
 
 
 class StateData(BaseModel):
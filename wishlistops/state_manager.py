@@ -8,21 +8,27 @@ Architecture: See 04_WishlistOps_System_Architecture_Diagrams.md Section 10
 Philosophy: Git as Database - all state is version controlled
 """
 
-import json
+import asyncio
 import logging
-import shutil
+import os
+import threading
+import time
+from collections import deque
+from contextlib import AbstractContextManager, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
-from filelock import FileLock
+from typing import Any, Iterator, Optional
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_serializer, field_validator
 
 from .models import AnnouncementDraft
 
 
 logger = logging.getLogger(__name__)
 
+# On-disk schema version; 2.0 stores recent_runs column-wise
+STATE_VERSION = "2.0"
+
 
 class StateError(Exception):
     """Base exception for state management errors."""
@@ -35,7 +41,9 @@ class StateCorruptedError(StateError):
 
 
 class WorkflowRun(BaseModel):
-    """Record of a single workflow run."""
+    """Record of a single workflow run (immutable once recorded)."""
+    model_config = ConfigDict(frozen=True)
+    
     timestamp: str
     tag: Optional[str] = None
     status: str  # "success", "failed", "skipped"
@@ -73,9 +81,34 @@ class StateData(BaseModel):
     current_draft: Optional[AnnouncementDraft] = None
     
     # Metadata
-    version: str = "1.0"
+    version: str = STATE_VERSION
     created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     updated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    
+    @field_validator('recent_runs', mode='before')
+    @classmethod
+    def runs_from_columns(cls, v):
+        """Accept the columnar 2.0 layout as well as the 1.0 list of runs."""
+        if isinstance(v, dict):
+            if not v:
+                return []
+            if 'timestamp' not in v:
+                raise ValueError("recent_runs is missing the 'timestamp' column")
+            if not all(isinstance(column, list) for column in v.values()):
+                raise ValueError("recent_runs columns must be lists")
+            lengths = {name: len(column) for name, column in v.items()}
+            if len(set(lengths.values())) > 1:
+                raise ValueError(f"recent_runs columns have different lengths: {lengths}")
+            return [dict(zip(v, row)) for row in zip(*v.values())]
+        return v
+    
+    @field_serializer('recent_runs', when_used='json')
+    def runs_to_columns(self, runs: list[WorkflowRun]) -> dict[str, list]:
+        """Write runs column-wise so each field name appears once on disk."""
+        return {
+            name: [getattr(run, name) for run in runs]
+            for name in WorkflowRun.model_fields
+        }
 
 
 class StateManager:
@@ -85,9 +118,18 @@ class StateManager:
     Provides thread-safe read/write operations on state.json file
     with atomic writes and backup management.
     
+    Updates are written immediately by default. Wrap several updates in
+    ``transaction()`` to write them with a single atomic save on exit.
+    A transaction applies to the whole instance: while one is open, updates
+    from any thread join the same batch and share its save or rollback.
+    
+    Writes are serialized with an in-process lock, which is enough for the
+    single-process Git-as-database workflow. Pass ``single_process=False``
+    to use a ``FileLock`` instead (e.g. CI workers sharing a checkout).
+    
     Attributes:
         state_path: Path to state.json file
-        lock_path: Path to lock file for synchronization
+        lock_path: Path to lock file (used when single_process is False)
         backup_dir: Directory for state backups
         state: Current state data
     """
@@ -95,24 +137,46 @@ class StateManager:
     MAX_RECENT_RUNS = 10
     MAX_BACKUPS = 5
     
-    def __init__(self, state_path: Path) -> None:
+    def __init__(self, state_path: Path, single_process: bool = True) -> None:
         """
         Initialize state manager.
         
         Args:
             state_path: Path to state.json file
+            single_process: If False, guard writes with a cross-process file lock
         """
         self.state_path = state_path
         self.lock_path = state_path.parent / f"{state_path.name}.lock"
         self.backup_dir = state_path.parent / ".state_backups"
+        self._single_process = single_process
+        self._lock: AbstractContextManager[Any]
+        if single_process:
+            self._lock = threading.RLock()
+        else:
+            # Only needed for multi-process mode; keep it off the import path
+            from filelock import FileLock
+            self._lock = FileLock(str(self.lock_path))
         
         # Ensure directories exist
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
+        # Backup filenames, oldest first (timestamped names sort chronologically)
+        self._backup_names: deque[str] = deque()
+        self._list_backups(refresh=True)
+        
         # Load or initialize state
         self.state = self._load_or_initialize()
         
+        # Pending-write tracking for batched saves
+        self._dirty = False
+        self._dirty_at: Optional[datetime] = None
+        self._batch_depth = 0
+        self._txn_snapshot: Optional[tuple[StateData, bool, Optional[datetime]]] = None
+        self._txn_failed = False
+        self._last_saved_bytes: Optional[bytes] = None
+        self._last_post_cache: tuple[Optional[str], Optional[datetime]] = (None, None)
+        
         logger.info("State manager initialized", extra={
             "state_path": str(state_path),
             "total_runs": self.state.total_runs
@@ -133,11 +197,17 @@ class StateManager:
             return StateData()
         
         try:
-            with open(self.state_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Parse and validate in one pass (pydantic-core), no intermediate dict
+            state = StateData.model_validate_json(self.state_path.read_bytes())
             
-            # Validate with Pydantic
-            state = StateData(**data)
+            # Older layouts are converted by the validators; stamp the new
+            # version so the next save writes the current schema
+            if state.version != STATE_VERSION:
+                logger.info("Migrating state schema", extra={
+                    "from_version": state.version,
+                    "to_version": STATE_VERSION
+                })
+                state.version = STATE_VERSION
             
             logger.info("State loaded successfully", extra={
                 "total_runs": state.total_runs,
@@ -145,15 +215,14 @@ class StateManager:
             })
             
             return state
-            
-        except json.JSONDecodeError as e:
-            raise StateCorruptedError(
-                f"State file corrupted (invalid JSON): {e}\n"
-                f"File: {self.state_path}\n"
-                f"Consider restoring from backup in {self.backup_dir}"
-            ) from e
         
         except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise StateCorruptedError(
+                    f"State file corrupted (invalid JSON): {e}\n"
+                    f"File: {self.state_path}\n"
+                    f"Consider restoring from backup in {self.backup_dir}"
+                ) from e
             raise StateCorruptedError(
                 f"State file has invalid structure: {e}\n"
                 f"File: {self.state_path}\n"
@@ -178,8 +247,9 @@ class StateManager:
             status: Run status ("success", "failed", "skipped")
             error: Error message if failed
         """
-        with FileLock(str(self.lock_path)):
-            now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            now_dt = datetime.now(timezone.utc)
+            now = now_dt.isoformat()
             
             # Update last run info
             self.state.last_run_timestamp = now
@@ -205,11 +275,10 @@ class StateManager:
                 draft_title=draft.title if draft else None,
                 error=error
             )
-            self.state.recent_runs.insert(0, run)
-            
-            # Keep only last N runs
-            if len(self.state.recent_runs) > self.MAX_RECENT_RUNS:
-                self.state.recent_runs = self.state.recent_runs[:self.MAX_RECENT_RUNS]
+            # Bounded deque keeps only the last N runs, newest first
+            recent = deque(self.state.recent_runs, maxlen=self.MAX_RECENT_RUNS)
+            recent.appendleft(run)
+            self.state.recent_runs = list(recent)
             
             # Update draft
             self.state.current_draft = draft
@@ -217,8 +286,8 @@ class StateManager:
             # Update timestamp
             self.state.updated_at = now
             
-            # Save
-            self._save()
+            # Save (deferred inside a transaction)
+            self._mark_dirty(now_dt)
             
             logger.info("State updated", extra={
                 "status": status,
@@ -226,6 +295,36 @@ class StateManager:
                 "tag": tag
             })
     
+    async def update_last_run_async(
+        self,
+        draft: Optional[AnnouncementDraft] = None,
+        tag: Optional[str] = None,
+        commit_sha: Optional[str] = None,
+        status: str = "success",
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Async variant of ``update_last_run``.
+        
+        Runs the update (and its disk write) in a worker thread so the
+        event loop stays free for in-flight network calls.
+        
+        Args:
+            draft: Generated announcement draft
+            tag: Git tag that triggered the run
+            commit_sha: Git commit SHA
+            status: Run status ("success", "failed", "skipped")
+            error: Error message if failed
+        """
+        await asyncio.to_thread(
+            self.update_last_run,
+            draft=draft,
+            tag=tag,
+            commit_sha=commit_sha,
+            status=status,
+            error=error
+        )
+    
     def update_last_post(self, title: str) -> None:
         """
         Update state after posting to Steam.
@@ -233,20 +332,86 @@ class StateManager:
         Args:
             title: Title of posted announcement
         """
-        with FileLock(str(self.lock_path)):
-            now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            now_dt = datetime.now(timezone.utc)
+            now = now_dt.isoformat()
             
             self.state.last_post_date = now
             self.state.last_post_title = title
             self.state.updated_at = now
             
-            self._save()
+            self._mark_dirty(now_dt)
             
             logger.info("Last post updated", extra={
                 "title": title,
                 "date": now
             })
     
+    @contextmanager
+    def transaction(self) -> Iterator["StateManager"]:
+        """
+        Batch several updates into a single save.
+        
+        The batch belongs to the instance, not the calling thread: it opens
+        when the first transaction starts and closes when the last open one
+        (nested or on another thread) exits. Every update made on this
+        manager in between, including plain ``update_last_run`` calls from
+        other threads, is part of the batch.
+        
+        When the batch closes, one atomic save (and backup) is made if every
+        block exited normally. If any block raised, all updates in the batch
+        are rolled back to the state at its start and nothing is written.
+        
+        Yields:
+            This state manager
+        """
+        with self._lock:
+            if self._batch_depth == 0:
+                self._txn_snapshot = (
+                    self.state.model_copy(deep=True), self._dirty, self._dirty_at
+                )
+                self._txn_failed = False
+            self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._txn_failed = True
+                self._end_transaction()
+            raise
+        with self._lock:
+            self._end_transaction()
+    
+    def _end_transaction(self) -> None:
+        """Close one transaction level; save or roll back when the batch ends."""
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+        snapshot, self._txn_snapshot = self._txn_snapshot, None
+        if self._txn_failed and snapshot is not None:
+            self.state, self._dirty, self._dirty_at = snapshot
+        else:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Save state to disk if there are pending changes."""
+        if not self._dirty:
+            return
+        self._save(now=self._dirty_at)
+        self._dirty = False
+    
+    def _mark_dirty(self, now: Optional[datetime] = None) -> None:
+        """
+        Record a pending change, saving now unless inside a transaction.
+        
+        Args:
+            now: Timestamp of the change, reused for the backup filename
+        """
+        self._dirty = True
+        self._dirty_at = now
+        if self._batch_depth == 0:
+            self.flush()
+    
     def get_last_post_date(self) -> Optional[datetime]:
         """
         Get the date of the last Steam post.
@@ -254,18 +419,27 @@ class StateManager:
         Returns:
             Datetime of last post, or None if never posted
         """
-        if not self.state.last_post_date:
+        raw = self.state.last_post_date
+        if not raw:
             return None
         
+        # Rate-limit checks call this repeatedly; only re-parse when the
+        # stored string actually changes.
+        cached_raw, cached_dt = self._last_post_cache
+        if raw == cached_raw:
+            return cached_dt
+        
         try:
-            dt = datetime.fromisoformat(self.state.last_post_date)
+            dt = datetime.fromisoformat(raw)
             # Ensure datetime is timezone-aware
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
-            return dt
         except ValueError:
-            logger.warning(f"Invalid last_post_date format: {self.state.last_post_date}")
-            return None
+            logger.warning(f"Invalid last_post_date format: {raw}")
+            dt = None
+        
+        self._last_post_cache = (raw, dt)
+        return dt
     
     def get_last_tag(self) -> Optional[str]:
         """
@@ -287,8 +461,7 @@ class StateManager:
         if not last_post:
             return None
         
-        delta = datetime.now(timezone.utc) - last_post
-        return delta.total_seconds() / 86400  # Convert to days
+        return (time.time() - last_post.timestamp()) / 86400  # Convert to days
     
     def should_allow_post(self, min_days: int) -> bool:
         """
@@ -338,31 +511,35 @@ class StateManager:
             "last_tag": self.state.last_tag
         }
     
-    def _save(self) -> None:
+    def _save(self, now: Optional[datetime] = None) -> None:
         """
         Save state to file atomically.
         
         Uses atomic write (write to temp, then rename) to prevent corruption.
-        Creates backup before overwriting.
+        Creates backup before overwriting. Skipped entirely when the
+        serialized state is byte-identical to the last save.
+        
+        Args:
+            now: Timestamp of the update being saved (defaults to current time)
         """
+        new_bytes = self.state.model_dump_json(indent=2).encode('utf-8')
+        if new_bytes == self._last_saved_bytes:
+            logger.debug("State unchanged, skipping save")
+            return
+        
         # Backup existing state
         if self.state_path.exists():
-            self._create_backup()
+            self._create_backup(now)
         
         # Write to temporary file
         temp_path = self.state_path.parent / f"{self.state_path.name}.tmp"
         
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(
-                    self.state.model_dump(mode='json'),
-                    f,
-                    indent=2,
-                    ensure_ascii=False
-                )
+            temp_path.write_bytes(new_bytes)
             
             # Atomic rename
             temp_path.replace(self.state_path)
+            self._last_saved_bytes = new_bytes
             
             logger.debug("State saved successfully")
             
@@ -372,14 +549,25 @@ class StateManager:
                 temp_path.unlink()
             raise StateError(f"Failed to save state: {e}") from e
     
-    def _create_backup(self) -> None:
+    def _create_backup(self, now: Optional[datetime] = None) -> None:
         """Create backup of current state file."""
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        now = now or datetime.now(timezone.utc)
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         backup_path = self.backup_dir / f"state_{timestamp}.json"
         
         try:
-            shutil.copy2(self.state_path, backup_path)
-            logger.debug(f"State backup created: {backup_path}")
+            # _save replaces state.json via rename, so a hard link keeps the
+            # old contents without copying any bytes
+            try:
+                os.link(self.state_path, backup_path)
+            except OSError:
+                # Cross-device, existing target, or no link support
+                import shutil
+                shutil.copy2(self.state_path, backup_path)
+            backup_names = self._list_backups()
+            if not backup_names or backup_names[-1] != backup_path.name:
+                backup_names.append(backup_path.name)
+            logger.debug("State backup created: %s", backup_path)
             
             # Clean old backups
             self._cleanup_old_backups()
@@ -387,14 +575,34 @@ class StateManager:
         except Exception as e:
             logger.warning(f"Failed to create backup: {e}")
     
+    def _list_backups(self, refresh: bool = False) -> deque[str]:
+        """
+        Get backup filenames, oldest first.
+        
+        In single-process mode the list is read once and then maintained in
+        memory. With ``single_process=False`` other managers add and prune
+        backups too, so the directory is re-read on every call.
+        
+        Args:
+            refresh: Re-read the backup directory regardless of mode
+            
+        Returns:
+            Backup filenames, oldest first
+        """
+        if refresh or not self._single_process:
+            self._backup_names = deque(
+                sorted(p.name for p in self.backup_dir.glob("state_*.json"))
+            )
+        return self._backup_names
+    
     def _cleanup_old_backups(self) -> None:
         """Remove old backups, keeping only last N."""
-        backups = sorted(self.backup_dir.glob("state_*.json"), reverse=True)
-        
-        for backup in backups[self.MAX_BACKUPS:]:
+        backup_names = self._list_backups()
+        while len(backup_names) > self.MAX_BACKUPS:
+            backup = self.backup_dir / backup_names.popleft()
             try:
                 backup.unlink()
-                logger.debug(f"Removed old backup: {backup}")
+                logger.debug("Removed old backup: %s", backup)
             except Exception as e:
                 logger.warning(f"Failed to remove backup {backup}: {e}")
     
@@ -412,17 +620,19 @@ class StateManager:
             backup_path = self.backup_dir / backup_name
         else:
             # Get latest backup
-            backups = sorted(self.backup_dir.glob("state_*.json"), reverse=True)
-            if not backups:
+            backup_names = self._list_backups()
+            if not backup_names:
                 raise StateError("No backups found")
-            backup_path = backups[0]
+            backup_path = self.backup_dir / backup_names[-1]
         
         if not backup_path.exists():
             raise StateError(f"Backup not found: {backup_path}")
         
         try:
+            import shutil
             shutil.copy2(backup_path, self.state_path)
             self.state = self._load_or_initialize()
+            self._last_saved_bytes = None
             logger.info(f"State restored from backup: {backup_path}")
         except Exception as e:
             raise StateError(f"Failed to restore backup: {e}") from e